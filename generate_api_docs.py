@@ -12,6 +12,7 @@ src = pathlib.Path("pypythia")
 api_files = {
     "msa": None,
     "raxmlng": None,
+    "rfdist": None,
     "prediction": None,
     "predictor": None,
     "custom_types": None,
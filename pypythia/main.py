@@ -3,10 +3,12 @@ import pathlib
 import sys
 import time
 
+import pandas as pd
+
 from pypythia.config import DEFAULT_MODEL_FILE, DEFAULT_RAXMLNG_EXE
 from pypythia.logger import get_header, log_runtime_information, logger
 from pypythia.msa import MSA, deduplicate_sequences, parse, remove_full_gap_sequences
-from pypythia.prediction import collect_features
+from pypythia.prediction import collect_features, predict_batch
 from pypythia.predictor import DifficultyPredictor
 from pypythia.raxmlng import RAxMLNG
 
@@ -16,14 +18,25 @@ def _parse_cli() -> argparse.Namespace:
         description="Parser for Pythia command line options."
     )
 
-    parser.add_argument(
+    msa_input = parser.add_mutually_exclusive_group(required=True)
+
+    msa_input.add_argument(
         "-m",
         "--msa",
         type=str,
-        required=True,
         help="Multiple Sequence Alignment to predict the difficulty for. Must be in either phylip or fasta format.",
     )
 
+    msa_input.add_argument(
+        "--msa-list",
+        type=str,
+        help="File containing the paths of multiple MSAs (one per line) to predict the difficulty for. "
+        "The MSAs are processed in parallel using multiple worker processes, each using the number of threads set "
+        "via --threads (default: 4). The results are stored in '{prefix}.pythia.csv' (default prefix: file name) "
+        "and reduced MSAs are stored next to the respective input MSA as '{msa}.reduced.phy'. "
+        "The options --storeTrees, --shap, and --verbose are not supported in this mode.",
+    )
+
     parser.add_argument(
         "-r",
         "--raxmlng",
@@ -115,7 +128,24 @@ def _parse_cli() -> argparse.Namespace:
         action="store_true",
     )
 
-    return parser.parse_args()
+    args = parser.parse_args()
+
+    if args.msa_list:
+        unsupported = [
+            option
+            for option, is_set in [
+                ("--storeTrees", args.storeTrees),
+                ("--shap", args.shap),
+                ("--verbose", args.verbose),
+            ]
+            if is_set
+        ]
+        if unsupported:
+            parser.error(
+                f"argument --msa-list: not allowed with argument(s) {', '.join(unsupported)}"
+            )
+
+    return args
 
 
 def _handle_duplicates(msa: MSA, force_duplicates: bool) -> MSA:
@@ -152,10 +182,81 @@ def _handle_full_gap_sequences(msa: MSA, force_full_gaps: bool) -> MSA:
         return msa
 
 
+def _read_msa_list(msa_list_file: pathlib.Path) -> list[pathlib.Path]:
+    return [
+        pathlib.Path(line.strip())
+        for line in msa_list_file.read_text().splitlines()
+        if line.strip()
+    ]
+
+
+def _predict_msa_list(args: argparse.Namespace) -> None:
+    msa_list_file = pathlib.Path(args.msa_list)
+    prefix = pathlib.Path(args.prefix) if args.prefix else msa_list_file
+
+    log_file = pathlib.Path(f"{prefix}.pythia.log")
+    logger.add(log_file, format="{message}")
+    log_file.write_text(get_header() + "\n")
+    results_file = pathlib.Path(f"{prefix}.pythia.csv")
+
+    msa_files = _read_msa_list(msa_list_file)
+    threads = args.threads or 4
+
+    log_runtime_information(
+        f"Starting prediction for {len(msa_files)} MSAs listed in {msa_list_file} "
+        f"using {threads} threads per MSA.",
+        log_runtime=True,
+    )
+
+    results = predict_batch(
+        msa_files,
+        model_file=pathlib.Path(args.predictor),
+        raxmlng=pathlib.Path(args.raxmlng),
+        threads=threads,
+        seed=args.seed,
+        deduplicate=not args.forceDuplicates,
+        remove_full_gaps=not args.forceFullGaps,
+        store_reduced_msas=True,
+    )
+    results.to_csv(results_file, index=False)
+
+    log_runtime_information("Done")
+    logger.info("")
+
+    n_failed = 0
+    for msa_file, (_, row) in zip(msa_files, results.iterrows()):
+        if pd.isna(row["difficulty"]):
+            n_failed += 1
+            logger.info(f"The prediction for MSA {msa_file} failed.")
+            continue
+
+        logger.info(
+            f"The predicted difficulty for MSA {row['msa_file']} is: {round(row['difficulty'], args.precision)}"
+        )
+        if row["msa_file"] != str(msa_file):
+            logger.warning(
+                f"WARNING: The MSA {msa_file} contained duplicate sequences and/or sequences containing only gaps. "
+                f"The predicted difficulty is only applicable to the reduced MSA {row['msa_file']}."
+            )
+
+    logger.info("")
+    logger.info(f"Results: {results_file}.")
+    if n_failed > 0:
+        logger.error(
+            f"ERROR: The prediction failed for {n_failed} of {len(msa_files)} MSAs. "
+            "See the log above for details."
+        )
+        sys.exit(1)
+
+
 def main():
     logger.info(get_header())
     args = _parse_cli()
 
+    if args.msa_list:
+        _predict_msa_list(args)
+        return
+
     # Format all paths to pathlib.Path objects and set a default value if not provided
     msa_file = pathlib.Path(args.msa)
     raxmlng_executable = pathlib.Path(args.raxmlng)
@@ -1,3 +1,4 @@
+import functools
 import math
 import pathlib
 from collections import Counter
@@ -131,9 +132,25 @@ def _guess_dtype(sequences: npt.NDArray) -> DataType:
     )
 
 
+def _cached(method):
+    """Caches the result of the given MSA method in the `_cache` dict of the MSA object."""
+
+    @functools.wraps(method)
+    def wrapper(self):
+        if method.__name__ not in self._cache:
+            self._cache[method.__name__] = method(self)
+        return self._cache[method.__name__]
+
+    return wrapper
+
+
 class MSA:
     """Multiple Sequence Alignment class
 
+    The MSA features (e.g. `n_patterns` or `entropy()`) are computed once and cached afterwards.
+    The MSA is thus assumed to be immutable: `taxa` and `sequences` must not be modified after initialization.
+    To remove sequences, use `deduplicate_sequences` or `remove_full_gap_sequences` which return a new MSA object.
+
     Args:
         taxa (npt.NDArray): Array of taxa names
         sequences (npt.NDArray): The data matrix containing the sequence data.
@@ -172,6 +189,7 @@ class MSA:
         self.name = name
 
         self.n_taxa, self.n_sites = self.sequences.shape
+        self._cache = {}
 
     def __str__(self):
         return f"MSA(name={self.name}, n_taxa={self.n_taxa}, n_sites={self.n_sites}, data_type={self.data_type})"
@@ -179,6 +197,7 @@ class MSA:
     def __repr__(self):
         return str(self)
 
+    @_cached
     def contains_full_gap_sequences(self) -> bool:
         """Check if the MSA contains full-gap sequences.
 
@@ -189,6 +208,7 @@ class MSA:
         """
         return np.any(np.all(self.sequences == GAP, axis=1))
 
+    @_cached
     def contains_duplicate_sequences(self) -> bool:
         """Check if the MSA contains duplicate sequences.
 
@@ -199,6 +219,7 @@ class MSA:
         return unique_sequences.shape[0] < self.sequences.shape[0]
 
     @property
+    @_cached
     def n_patterns(self) -> int:
         """Returns the number of unique patterns in the MSA.
 
@@ -212,6 +233,7 @@ class MSA:
         return len(un) - ((GAP * self.n_taxa) in un)
 
     @property
+    @_cached
     def proportion_gaps(self) -> float:
         """Returns the proportion of gap characters in the MSA.
         Note that prior to calculating the percentage, full-gap sites are removed.
@@ -225,6 +247,7 @@ class MSA:
         return np.sum(full_gap_sites_removed == GAP) / full_gap_sites_removed.size
 
     @property
+    @_cached
     def proportion_invariant(self) -> float:
         """Returns the proportion of invariant sites in the MSA.
         A site is considered invariant if all sequences have the same character at that site.
@@ -262,6 +285,7 @@ class MSA:
 
         return invariant_count / non_gap_site_count
 
+    @_cached
     def entropy(self) -> float:
         """Returns the entropy of the MSA.
 
@@ -282,6 +306,7 @@ class MSA:
 
         return np.mean([_site_entropy(site) for site in self.sequences.T])
 
+    @_cached
     def pattern_entropy(self) -> float:
         """Returns an entropy-like metric based on the number of occurrences of all patterns of the MSA.
 
@@ -299,6 +324,7 @@ class MSA:
         pattern_counts = np.array(list(pattern_counter.values()))
         return np.sum(pattern_counts * np.log(pattern_counts))
 
+    @_cached
     def bollback_multinomial(self) -> float:
         """
         Returns the Bollback multinomial metric for the MSA.
@@ -316,6 +342,7 @@ class MSA:
         pattern_entropy = self.pattern_entropy()
         return pattern_entropy - self.n_sites * math.log(self.n_sites)
 
+    @_cached
     def get_raxmlng_model(self) -> str:
         """Returns a RAxML-NG model string based on the data type.
 
@@ -1,5 +1,9 @@
+import functools
+import os
 import pathlib
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from tempfile import TemporaryDirectory
 from typing import Optional
 
@@ -14,6 +18,23 @@ from pypythia.msa import MSA, deduplicate_sequences, parse, remove_full_gap_sequ
 from pypythia.predictor import DifficultyPredictor
 from pypythia.raxmlng import RAxMLNG
 
+# Names of all features computed by collect_features, in the order of the returned columns
+FEATURE_NAMES = (
+    "num_taxa",
+    "num_sites",
+    "num_patterns",
+    "num_patterns/num_taxa",
+    "num_sites/num_taxa",
+    "num_patterns/num_sites",
+    "proportion_gaps",
+    "proportion_invariant",
+    "entropy",
+    "bollback",
+    "pattern_entropy",
+    "avg_rfdist_parsimony",
+    "proportion_unique_topos_parsimony",
+)
+
 
 def predict_difficulty(
     msa_file: pathlib.Path,
@@ -60,22 +81,186 @@ def predict_difficulty(
         )
 
     raxmlng = RAxMLNG(**{"exe_path": raxmlng} if raxmlng else {})
+
+    msa_features = _predict_difficulty(
+        msa_file,
+        predictor,
+        raxmlng,
+        threads=threads,
+        seed=seed,
+        file_format=file_format,
+        data_type=data_type,
+        deduplicate=deduplicate,
+        remove_full_gaps=remove_full_gaps,
+        reduced_msa_file=reduced_msa_file,
+    )
+    return msa_features["difficulty"].iloc[0]
+
+
+def _predict_difficulty(
+    msa_file: pathlib.Path,
+    predictor: DifficultyPredictor,
+    raxmlng: RAxMLNG,
+    threads: int = None,
+    seed: int = 0,
+    file_format: Optional[FileFormat] = None,
+    data_type: Optional[DataType] = None,
+    deduplicate: bool = True,
+    remove_full_gaps: bool = True,
+    reduced_msa_file: Optional[pathlib.Path] = None,
+    only_store_reduced: bool = False,
+) -> pd.DataFrame:
+    # Returns the features, the predicted difficulty, and the MSA file the prediction applies to.
+    # If only_store_reduced is set, reduced_msa_file is only written if sequences were actually removed.
     msa = parse(msa_file, file_format=file_format, data_type=data_type)
 
+    is_reduced = False
     if deduplicate and msa.contains_duplicate_sequences():
         msa = deduplicate_sequences(msa)
+        is_reduced = True
     if remove_full_gaps and msa.contains_full_gap_sequences():
         msa = remove_full_gap_sequences(msa)
+        is_reduced = True
+
+    if only_store_reduced and not is_reduced:
+        reduced_msa_file = None
 
     if reduced_msa_file:
         msa.write(reduced_msa_file)
 
-    msa_features = collect_features(
-        msa, msa_file, raxmlng, log_info=False, threads=threads, seed=seed
+    prediction_msa_file = (
+        reduced_msa_file if is_reduced and reduced_msa_file else msa_file
+    )
+
+    with TemporaryDirectory() as tmpdir:
+        if is_reduced:
+            # RAxML-NG needs to infer the parsimony trees for the reduced MSA as well
+            if reduced_msa_file is None:
+                reduced_msa_file = pathlib.Path(tmpdir) / "reduced.phy"
+                msa.write(reduced_msa_file)
+            msa_file = reduced_msa_file
+
+        msa_features = collect_features(
+            msa, msa_file, raxmlng, log_info=False, threads=threads, seed=seed
+        )
+    msa_features["difficulty"] = predictor.predict(msa_features)
+    msa_features["msa_file"] = str(prediction_msa_file)
+
+    return msa_features
+
+
+# Predictor and RAxMLNG object of the current worker process in predict_batch
+_worker_predictor: Optional[DifficultyPredictor] = None
+_worker_raxmlng: Optional[RAxMLNG] = None
+
+
+def _init_worker(predictor: DifficultyPredictor, raxmlng: pathlib.Path) -> None:
+    global _worker_predictor, _worker_raxmlng
+    _worker_predictor = predictor
+    _worker_raxmlng = RAxMLNG(exe_path=raxmlng)
+
+
+def _predict_difficulty_worker(msa_file: pathlib.Path, **kwargs) -> pd.DataFrame:
+    return _predict_difficulty(msa_file, _worker_predictor, _worker_raxmlng, **kwargs)
+
+
+def predict_batch(
+    msa_files: list[pathlib.Path],
+    model_file: Optional[pathlib.Path] = DEFAULT_MODEL_FILE,
+    raxmlng: Optional[pathlib.Path] = DEFAULT_RAXMLNG_EXE,
+    threads: int = 4,
+    n_workers: Optional[int] = None,
+    seed: int = 0,
+    deduplicate: bool = True,
+    remove_full_gaps: bool = True,
+    store_reduced_msas: bool = False,
+) -> pd.DataFrame:
+    """Predict the difficulty of multiple MSAs in parallel using the PyPythia difficulty predictor.
+
+    The MSAs are distributed among `n_workers` worker processes. Each worker loads the predictor and sets up RAxML-NG
+    only once and uses `threads` threads for the parallel parsimony tree inference of each MSA.
+    Per default, the MSAs are deduplicated and full gap sequences are removed before the difficulty is predicted.
+    Note that the file format and data type of each MSA are inferred based on the file content.
+
+    If the prediction fails for an MSA (e.g. because the file cannot be parsed or RAxML-NG fails), the error is logged
+    and the features and difficulty of this MSA are set to NaN. The predictions for all other MSAs are unaffected.
+    Errors that are not specific to a single MSA, such as an invalid model file or a terminated worker process,
+    are raised.
+
+    Args:
+        msa_files (list[pathlib.Path]): Paths to the MSA files. Note that the MSA files must be in either FASTA or PHYLIP format.
+        model_file (pathlib.Path, optional): Path to the trained difficulty predictor model.
+            Defaults to the latest model shipped with PyPythia.
+        raxmlng (pathlib.Path, optional): Path to the RAxML-NG executable.
+            If not set, uses the RAxML-NG binary found in the PATH environment variable.
+        threads (int, optional): Number of threads each worker uses for the parallel parsimony tree inference.
+            Defaults to 4.
+        n_workers (int, optional): Number of worker processes. Defaults to None. In this case, the number of available
+            CPUs divided by `threads` is used.
+        seed (int, optional): Random seed to use for the parsimony tree inference. Defaults to 0.
+        deduplicate (bool, optional): If True, remove duplicate sequences from the MSAs. Defaults to True.
+        remove_full_gaps (bool, optional): If True, remove full gap sequences from the MSAs. Defaults to True.
+        store_reduced_msas (bool, optional): If True, each MSA that contains duplicate sequences or full gap sequences
+            is stored after their removal next to the input MSA as `{msa_file}.reduced.phy`. Defaults to False.
+
+    Returns:
+        pd.DataFrame: Dataframe containing one row per MSA in the order of `msa_files`. The columns contain all
+            features (see `collect_features`), the predicted `difficulty`, and the `msa_file` the prediction applies to.
+            If `store_reduced_msas` is set and an MSA was reduced, `msa_file` refers to the stored reduced MSA.
+    """
+    if raxmlng is None:
+        raise PyPythiaException(
+            "Path to the RAxML-NG executable is required if 'raxml-ng' is not in $PATH."
+        )
+
+    # load the predictor before starting the workers such that an invalid model file fails immediately
+    predictor = DifficultyPredictor(model_file=model_file)
+
+    if n_workers is None:
+        n_workers = max(1, (os.cpu_count() or 1) // threads)
+
+    predict = functools.partial(
+        _predict_difficulty_worker,
+        threads=threads,
+        seed=seed,
+        deduplicate=deduplicate,
+        remove_full_gaps=remove_full_gaps,
+        only_store_reduced=True,
     )
-    difficulty = predictor.predict(msa_features)
 
-    return difficulty[0]
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_worker,
+        initargs=(predictor, raxmlng),
+    ) as executor:
+        futures = [
+            executor.submit(
+                predict,
+                msa_file,
+                reduced_msa_file=(
+                    pathlib.Path(f"{msa_file}.reduced.phy")
+                    if store_reduced_msas
+                    else None
+                ),
+            )
+            for msa_file in msa_files
+        ]
+
+        for msa_file, future in zip(msa_files, futures):
+            try:
+                results.append(future.result())
+            except BrokenProcessPool:
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Predicting the difficulty for MSA {msa_file} failed: {e}"
+                )
+                failed = {name: np.nan for name in FEATURE_NAMES}
+                failed.update(difficulty=np.nan, msa_file=str(msa_file))
+                results.append(pd.DataFrame(failed, index=[0]))
+
+    return pd.concat(results, ignore_index=True)
 
 
 def collect_features(
@@ -91,6 +276,10 @@ def collect_features(
 
     Args:
         msa (MSA): MSA object corresponding to the MSA file to compute the features for.
+        msa_file (pathlib.Path): Path to the MSA file used for the RAxML-NG parsimony tree inference.
+            Note that this file needs to contain the same data as the given MSA object. In particular, if the MSA object
+            is the result of `deduplicate_sequences` or `remove_full_gap_sequences`, write the reduced MSA to a file
+            first and pass this file.
         raxmlng (RAxMLNG): Initialized RAxMLNG object.
         pars_trees_file (pathlib.Path, optional): Path to store the inferred parsimony trees. Defaults to None.
             In this case, the trees are not stored.
@@ -105,10 +294,19 @@ def collect_features(
     if not log_info:
         logger.remove()
 
-    with TemporaryDirectory() as tmpdir:
-        msa_file = msa_file
+    with TemporaryDirectory() as tmpdir, ThreadPoolExecutor(max_workers=2) as executor:
+        msa_file = msa_file.absolute()
+        pars_prefix = (pathlib.Path(tmpdir) / "pars").resolve()
         model = msa.get_raxmlng_model()
 
+        # The MSA features are computed in the background while RAxML-NG infers the parsimony trees
+        n_patterns = executor.submit(getattr, msa, "n_patterns")
+        proportion_gaps = executor.submit(getattr, msa, "proportion_gaps")
+        proportion_invariant = executor.submit(getattr, msa, "proportion_invariant")
+        entropy = executor.submit(msa.entropy)
+        # bollback_multinomial is derived from the (cached) pattern entropy once it is available
+        pattern_entropy = executor.submit(msa.pattern_entropy)
+
         log_runtime_information("Retrieving num_taxa, num_sites.", log_runtime=True)
 
         n_pars_trees = 24
@@ -119,7 +317,7 @@ def collect_features(
         trees = raxmlng.infer_parsimony_trees(
             msa_file,
             model,
-            pathlib.Path(tmpdir) / "pars",
+            pars_prefix,
             redo=None,
             seed=seed,
             n_trees=n_pars_trees,
@@ -134,21 +332,25 @@ def collect_features(
         log_runtime_information(
             "Computing the RF-Distance for the parsimony trees.", log_runtime=True
         )
-        num_topos, rel_rfdist, _ = raxmlng.get_rfdistance_results(trees, redo=None)
-
-        features = {
-            "num_taxa": msa.n_taxa,
-            "num_sites": msa.n_sites,
-            "num_patterns": msa.n_patterns,
-            "num_patterns/num_taxa": msa.n_patterns / msa.n_taxa,
-            "num_sites/num_taxa": msa.n_sites / msa.n_taxa,
-            "num_patterns/num_sites": msa.n_patterns / msa.n_sites,
-            "proportion_gaps": msa.proportion_gaps,
-            "proportion_invariant": msa.proportion_invariant,
-            "entropy": msa.entropy(),
-            "bollback": msa.bollback_multinomial(),
-            "pattern_entropy": msa.pattern_entropy(),
-            "avg_rfdist_parsimony": rel_rfdist,
-            "proportion_unique_topos_parsimony": num_topos / n_pars_trees,
-        }
+        num_topos, rel_rfdist, _ = raxmlng.get_rfdistance_results(trees)
+
+        n_patterns = n_patterns.result()
+        pattern_entropy = pattern_entropy.result()
+
+        values = (
+            msa.n_taxa,
+            msa.n_sites,
+            n_patterns,
+            n_patterns / msa.n_taxa,
+            msa.n_sites / msa.n_taxa,
+            n_patterns / msa.n_sites,
+            proportion_gaps.result(),
+            proportion_invariant.result(),
+            entropy.result(),
+            msa.bollback_multinomial(),
+            pattern_entropy,
+            rel_rfdist,
+            num_topos / n_pars_trees,
+        )
+        features = dict(zip(FEATURE_NAMES, values))
         return pd.DataFrame(features, index=[0])
@@ -1,6 +1,6 @@
 import pathlib
 import warnings
-from typing import Optional
+from typing import Optional, Union
 
 import lightgbm as lgb
 import numpy as np
@@ -44,20 +44,24 @@ class DifficultyPredictor:
     def __repr__(self):
         return self.__str__()
 
-    def _check_query(self, query: pd.DataFrame):
-        if not set(self.features).issubset(query.columns):
-            missing_features = set(self.features) - set(query.columns)
+    def _check_query(self, query: Union[pd.DataFrame, dict[str, float]]):
+        # for DataFrames, keys() returns the column names
+        if not set(self.features).issubset(query.keys()):
+            missing_features = set(self.features) - set(query.keys())
             raise PyPythiaException(
                 "The provided query does not contain all features the predictor was trained with. "
                 "Missing features: " + ", ".join(missing_features)
             )
 
-    def predict(self, query: pd.DataFrame) -> npt.NDArray[np.float64]:
+    def predict(
+        self, query: Union[pd.DataFrame, dict[str, float]]
+    ) -> npt.NDArray[np.float64]:
         """Predict the difficulty for a set of MSAs defined by rows in the given query dataframe.
 
         Args:
-            query (pd.DataFrame): DataFrame containing the features for which to predict the difficulty.
+            query (pd.DataFrame | dict[str, float]): DataFrame containing the features for which to predict the difficulty.
                 Each row in the DataFrame corresponds to a single MSA and the columns correspond to the features.
+                Alternatively, the features of a single MSA can be passed as dict mapping the feature names to values.
 
         Returns:
             A numpy array of predicted difficulties for the provided set of MSAs in float64 format.
@@ -66,8 +70,18 @@ class DifficultyPredictor:
         """
         self._check_query(query)
 
+        if isinstance(query, dict):
+            # avoid the DataFrame construction for a single MSA
+            query = np.fromiter(
+                (query[feature] for feature in self.features),
+                dtype=np.float64,
+                count=len(self.features),
+            ).reshape(1, -1)
+        else:
+            query = query[self.features]
+
         try:
-            prediction = self.predictor.predict(query[self.features])
+            prediction = self.predictor.predict(query)
             prediction = prediction.clip(min=0.0, max=1.0)
             return prediction
         except Exception as e:
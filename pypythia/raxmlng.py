@@ -1,15 +1,23 @@
+import functools
+import os
 import pathlib
+import re
 import subprocess
-from tempfile import TemporaryDirectory
+import sys
+import tempfile
 from typing import Optional
 
 from pypythia.config import DEFAULT_RAXMLNG_EXE
 from pypythia.custom_errors import RAxMLNGError
+from pypythia.logger import logger
+from pypythia.rfdist import rfdist_from_newick_file
 
 
 def run_raxmlng_command(cmd: list[str]) -> None:
     """Helper method to run a RAxML-NG command.
 
+    The output of RAxML-NG is written to a temporary file and only read in case the command fails.
+
     Args:
         cmd (list): List of strings representing the RAxML-NG command to run.
 
@@ -17,50 +25,93 @@ def run_raxmlng_command(cmd: list[str]) -> None:
         RAxMLNGError: If the RAxML-NG command fails with a CalledProcessError.
         RuntimeError: If the RAxML-NG command fails with any other error.
     """
+    with tempfile.TemporaryFile(mode="w+", encoding="utf-8") as output:
+        try:
+            subprocess.run(cmd, stdout=output, check=True)
+        except subprocess.CalledProcessError as e:
+            # RAxML-NG reports errors on stdout, so we need to preserve it for the RAxMLNGError
+            output.seek(0)
+            e.output = output.read()
+            raise RAxMLNGError(subprocess_exception=e)
+        except Exception as e:
+            raise RuntimeError("Running RAxML-NG command failed.") from e
+
+
+def _parse_raxmlng_version(version_output: str) -> Optional[tuple[int, int, int]]:
+    match = re.search(r"RAxML-NG v\. (\d+)\.(\d+)\.(\d+)", version_output)
+    if match is None:
+        return None
+    return tuple(int(v) for v in match.groups())
+
+
+@functools.lru_cache
+def _raxmlng_version(exe_abs: str) -> Optional[tuple[int, int, int]]:
+    # cached per executable such that each RAxMLNG instance does not spawn an additional process
     try:
-        subprocess.check_output(cmd, encoding="utf-8")
-    except subprocess.CalledProcessError as e:
-        raise RAxMLNGError(subprocess_exception=e)
-    except Exception as e:
-        raise RuntimeError("Running RAxML-NG command failed.") from e
+        output = subprocess.run(
+            [exe_abs, "--version"],
+            capture_output=True,
+            encoding="utf-8",
+        ).stdout
+    except Exception:
+        return None
+    return _parse_raxmlng_version(output)
 
 
-def _get_value_from_line(line: str, search_string: str) -> float:
-    line = line.strip()
-    if search_string in line:
-        _, value = line.rsplit(" ", 1)
-        return float(value)
+# ISA-specific RAxML-NG builds, ordered from fastest to slowest
+_RAXMLNG_ISAS = ["avx512", "avx2", "avx", "sse3"]
 
-    raise ValueError(
-        f"The given line '{line}' does not contain the search string '{search_string}'."
-    )
 
+def _cpu_flags() -> set[str]:
+    flags = set()
+    try:
+        if sys.platform.startswith("linux"):
+            for line in pathlib.Path("/proc/cpuinfo").open():
+                if line.startswith("flags"):
+                    flags = set(line.split(":", 1)[1].split())
+                    break
+        elif sys.platform == "darwin":
+            output = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.features", "machdep.cpu.leaf7_features"],
+                capture_output=True,
+                encoding="utf-8",
+            ).stdout
+            flags = set(output.lower().split())
+    except Exception:
+        return set()
+
+    # Linux reports SSE3 as "pni" (Prescott New Instructions)
+    if "pni" in flags:
+        flags.add("sse3")
+    # macOS reports AVX as "AVX1.0"
+    if "avx1.0" in flags:
+        flags.add("avx")
+    if "avx512f" in flags:
+        flags.add("avx512")
+    return flags
 
-def _get_raxmlng_rfdist_results(log_file: pathlib.Path) -> tuple[float, float, float]:
-    abs_rfdist = None
-    rel_rfdist = None
-    num_topos = None
 
-    for line in log_file.open().readlines():
-        line = line.strip()
+def _select_isa_binary(exe_path: pathlib.Path) -> pathlib.Path:
+    """Returns the fastest ISA-specific RAxML-NG binary next to the given one that is supported by the host CPU.
 
-        if "Average absolute RF distance in this tree set:" in line:
-            abs_rfdist = _get_value_from_line(
-                line, "Average absolute RF distance in this tree set:"
-            )
-        elif "Average relative RF distance in this tree set:" in line:
-            rel_rfdist = _get_value_from_line(
-                line, "Average relative RF distance in this tree set:"
-            )
-        elif "Number of unique topologies in this tree set:" in line:
-            num_topos = _get_value_from_line(
-                line, "Number of unique topologies in this tree set:"
-            )
+    For `exe_path = /path/to/raxml-ng`, the binaries `/path/to/raxml-ng-avx512`, `/path/to/raxml-ng-avx2`,
+    `/path/to/raxml-ng-avx`, and `/path/to/raxml-ng-sse3` are considered. If `exe_path` is a directory,
+    the binaries `raxml-ng-{isa}` and `raxml-ng` in this directory are considered.
+    If no supported ISA-specific binary is found, the given binary is returned.
+    """
+    if exe_path.is_dir():
+        directory, name = exe_path, "raxml-ng"
+    else:
+        directory, name = exe_path.parent, exe_path.name
 
-    if abs_rfdist is None or rel_rfdist is None or num_topos is None:
-        raise ValueError("Error parsing raxml-ng log.")
+    cpu_flags = _cpu_flags()
+    for isa in _RAXMLNG_ISAS:
+        candidate = directory / f"{name}-{isa}"
+        if isa in cpu_flags and candidate.is_file() and os.access(candidate, os.X_OK):
+            logger.info(f"Using the {isa.upper()} RAxML-NG binary {candidate}.")
+            return candidate
 
-    return num_topos, rel_rfdist, abs_rfdist
+    return directory / name
 
 
 class RAxMLNG:
@@ -68,17 +119,57 @@ class RAxMLNG:
 
     Args:
         exe_path (pathlib.Path, optional): Path to the RAxML-NG executable. Defaults to the binary found in the PATH environment variable.
+            Can also be a directory containing the RAxML-NG executable(s).
+        select_isa_binary (bool, optional): If True and an ISA-specific build of RAxML-NG (e.g. `raxml-ng-avx2`)
+            that is supported by the host CPU is located next to `exe_path`, this binary is used instead.
+            Defaults to True.
 
     Attributes:
         exe_path (pathlib.Path): Path to the RAxML-NG executable.
     """
 
-    def __init__(self, exe_path: Optional[pathlib.Path] = DEFAULT_RAXMLNG_EXE):
+    def __init__(
+        self,
+        exe_path: Optional[pathlib.Path] = DEFAULT_RAXMLNG_EXE,
+        select_isa_binary: bool = True,
+    ):
+        if exe_path is not None and select_isa_binary:
+            exe_path = _select_isa_binary(pathlib.Path(exe_path))
         self.exe_path = exe_path
 
+    @property
+    def exe_path(self) -> Optional[pathlib.Path]:
+        """Path to the RAxML-NG executable."""
+        return self._exe_path
+
+    @exe_path.setter
+    def exe_path(self, exe_path: Optional[pathlib.Path]) -> None:
+        # the absolute path is resolved once here such that it is not recomputed for each RAxML-NG call
+        self._exe_path = exe_path
+        self._exe_abs = (
+            str(pathlib.Path(exe_path).absolute()) if exe_path is not None else None
+        )
+
+    @property
+    def version(self) -> Optional[tuple[int, int, int]]:
+        """Version of the RAxML-NG binary as tuple (major, minor, patch).
+
+        The version is determined by running `raxml-ng --version` on first access and cached per executable afterwards.
+        If the version cannot be determined, the version is None.
+        """
+        if self._exe_abs is None:
+            return None
+        return _raxmlng_version(self._exe_abs)
+
+    @property
+    def supports_workers(self) -> bool:
+        """Whether the RAxML-NG binary supports parallel tree searches using `--workers` (RAxML-NG >= 1.1.0)."""
+        return self.version is not None and self.version >= (1, 1, 0)
+
     def _base_cmd(
         self, msa_file: pathlib.Path, model: str, prefix: pathlib.Path, **kwargs
     ) -> list[str]:
+        # RAxML-NG runs in the current working directory, so msa_file and prefix are passed as they are
         additional_settings = []
         for key, value in kwargs.items():
             if value is None:
@@ -87,41 +178,16 @@ class RAxMLNG:
                 additional_settings += [f"--{key}", str(value)]
 
         return [
-            str(self.exe_path.absolute()),
+            self._exe_abs,
             "--msa",
-            str(msa_file.absolute()),
+            str(msa_file),
             "--model",
             model,
             "--prefix",
-            str(prefix.absolute()),
+            str(prefix),
             *additional_settings,
         ]
 
-    def _run_alignment_parse(
-        self, msa_file: pathlib.Path, model: str, prefix: pathlib.Path, **kwargs
-    ) -> None:
-        cmd = self._base_cmd(msa_file, model, prefix, parse=None, **kwargs)
-        run_raxmlng_command(cmd)
-
-    def _run_rfdist(
-        self, trees_file: pathlib.Path, prefix: pathlib.Path, **kwargs
-    ) -> None:
-        additional_settings = []
-        for key, value in kwargs.items():
-            if value is None:
-                additional_settings += [f"--{key}"]
-            else:
-                additional_settings += [f"--{key}", str(value)]
-        cmd = [
-            str(self.exe_path.absolute()),
-            "--rfdist",
-            str(trees_file.absolute()),
-            "--prefix",
-            str(prefix.absolute()),
-            *additional_settings,
-        ]
-        run_raxmlng_command(cmd)
-
     def infer_parsimony_trees(
         self,
         msa_file: pathlib.Path,
@@ -132,20 +198,39 @@ class RAxMLNG:
     ) -> pathlib.Path:
         """Method that infers n_trees using the RAxML-NG implementation of maximum parsimony.
 
+        Note that this method intentionally only runs RAxML-NG in `--start` mode, meaning RAxML-NG only generates
+        the parsimony starting trees and does not perform any maximum likelihood optimization or tree search.
+
         Args:
             msa_file (pathlib.Path): Filepath pointing to the MSA file.
             model (str): String representation of the substitution model to use. Needs to be a valid RAxML-NG model.
                 For example "GTR+G" for DNA data or "LG+G" for protein data.
-            prefix (pathlib.Path): Prefix to use when running RAxML-NG.
+            prefix (pathlib.Path): Prefix to use when running RAxML-NG. Relative paths are relative to the current
+                working directory.
             n_trees (int): Number of trees to infer. Defaults to 24.
             **kwargs: Additional arguments to pass to the RAxML-NG command.
                 The name of the kwarg needs to be a valid RAxML-NG flag.
                 For flags with a value pass it like this: "flag=value", for flags without a value pass it like this: "flag=None".
                 See https://github.com/amkozlov/raxml-ng for all options.
+                If the RAxML-NG binary supports it, the parsimony trees are inferred in parallel using `--workers`.
+                In this case, a given number of threads `threads=n` is split among `n // 2` workers. Any other value
+                of `threads` (e.g. `threads="auto{8}"`) is passed to RAxML-NG as is, using `--workers auto`.
 
         Returns:
             Filepath pointing to the inferred maximum parsimony trees.
         """
+        if self.supports_workers and "workers" not in kwargs:
+            threads = kwargs.pop("threads", None)
+            if threads is None:
+                kwargs.update(workers="auto", threads="auto")
+            elif str(threads).isdigit():
+                kwargs.update(
+                    workers=max(1, int(threads) // 2), threads=f"auto{{{threads}}}"
+                )
+            else:
+                # e.g. threads="auto{8}", RAxML-NG determines the number of workers itself
+                kwargs.update(workers="auto", threads=threads)
+
         cmd = self._base_cmd(
             msa_file, model, prefix, start=None, tree=f"pars{{{n_trees}}}", **kwargs
         )
@@ -157,23 +242,18 @@ class RAxMLNG:
     ) -> tuple[float, float, float]:
         """Method that computes the number of unique topologies, relative RF-Distance, and absolute RF-Distance for the given set of trees.
 
+        Note that the RF-Distances are computed in-process (see `pypythia.rfdist.rfdist_from_newick_file`)
+        and not using the RAxML-NG binary. The arguments `prefix` and `kwargs` are thus ignored
+        and only kept for backwards compatibility.
+
         Args:
             trees_file (pathlib.Path): Filepath pointing to the file containing the trees.
-            prefix (pathlib.Path, optional): Prefix to use when running RAxML-NG. Defaults to None. If None, a temporary directory is used.
-            **kwargs: Additional arguments to pass to the RAxML-NG command.
-                The name of the kwarg needs to be a valid RAxML-NG flag.
-                For flags with a value pass it like this: "flag=value", for flags without a value pass it like this: "flag=None".
-                See
+            prefix (pathlib.Path, optional): Unused.
+            **kwargs: Unused.
 
         Returns:
             num_topos (float): Number of unique topologies of the given set of trees.
             rel_rfdist (float): Relative RF-Distance of the given set of trees. Computed as average over all pairwise RF-Distances. Value between 0.0 and 1.0.
             abs_rfdist (float): Absolute RF-Distance of the given set of trees.
         """
-        with TemporaryDirectory() as tmpdir:
-            tmpdir = pathlib.Path(tmpdir)
-            if not prefix:
-                prefix = tmpdir / "rfdist"
-            self._run_rfdist(trees_file, prefix, **kwargs)
-            log_file = pathlib.Path(f"{prefix}.raxml.log")
-            return _get_raxmlng_rfdist_results(log_file)
+        return rfdist_from_newick_file(trees_file)
@@ -0,0 +1,305 @@
+import pathlib
+from typing import Union
+
+import numpy as np
+import numpy.typing as npt
+
+from pypythia.custom_errors import PyPythiaException
+
+# A tree is stored as list of nodes in post-order, rooted at the first taxon of the first tree in the file.
+# A leaf node is stored as the (global) integer index of its taxon, an inner node is stored as tuple containing
+# the post-order positions of its children. The last node in the list is the (trivial) node adjacent to the root taxon.
+PostOrderTree = list[Union[int, tuple[int, ...]]]
+
+_NEWICK_DELIMITERS = set("(),:;")
+
+# Up to this number of taxa, bipartitions are compared as packed uint64 bitsets.
+# For larger trees, we fall back to the interval representation of Day's algorithm.
+_MAX_BITSET_TAXA = 256
+
+
+def _parse_newick(newick: str) -> tuple[list[list[int]], dict[int, str]]:
+    """Parses the given Newick string into an unrooted adjacency list.
+
+    Branch lengths, support values, and inner node labels are ignored.
+
+    Args:
+        newick (str): Newick string of a single tree.
+
+    Returns:
+        neighbors (list[list[int]]): For each node, the list of its neighboring nodes.
+        leaf_labels (dict[int, str]): Mapping of the leaf nodes to their taxon names.
+    """
+    neighbors: list[list[int]] = []
+    leaf_labels: dict[int, str] = {}
+    stack: list[int] = []
+
+    def _add_node() -> int:
+        neighbors.append([])
+        node = len(neighbors) - 1
+        if stack:
+            neighbors[stack[-1]].append(node)
+            neighbors[node].append(stack[-1])
+        return node
+
+    i = 0
+    n = len(newick)
+    after_closing_bracket = False
+
+    while i < n:
+        char = newick[i]
+        if char.isspace():
+            i += 1
+        elif char == ",":
+            after_closing_bracket = False
+            i += 1
+        elif char == "(":
+            stack.append(_add_node())
+            after_closing_bracket = False
+            i += 1
+        elif char == ")":
+            if not stack:
+                raise PyPythiaException(
+                    f"Unbalanced brackets in Newick string: {newick}"
+                )
+            stack.pop()
+            after_closing_bracket = True
+            i += 1
+        elif char == ":":
+            # skip the branch length
+            i += 1
+            while i < n and newick[i] not in _NEWICK_DELIMITERS:
+                i += 1
+        elif char == ";":
+            break
+        else:
+            if char == "'":
+                end = newick.index("'", i + 1)
+                label = newick[i + 1 : end]
+                i = end + 1
+            else:
+                start = i
+                while i < n and newick[i] not in _NEWICK_DELIMITERS:
+                    i += 1
+                label = newick[start:i].strip()
+
+            if not after_closing_bracket:
+                # labels following a closing bracket belong to inner nodes (e.g. support values)
+                leaf_labels[_add_node()] = label
+            after_closing_bracket = False
+
+    if stack:
+        raise PyPythiaException(f"Unbalanced brackets in Newick string: {newick}")
+
+    # A rooted Newick tree has a root node of degree two that does not induce a split.
+    # Since RF-Distances are computed on unrooted trees, we remove this node.
+    if len(neighbors[0]) == 2 and 0 not in leaf_labels:
+        left, right = neighbors[0]
+        neighbors[left][neighbors[left].index(0)] = right
+        neighbors[right][neighbors[right].index(0)] = left
+        neighbors[0] = []
+
+    return neighbors, leaf_labels
+
+
+def _to_post_order(
+    neighbors: list[list[int]], leaf_labels: dict[int, str], taxon_ids: dict[str, int]
+) -> PostOrderTree:
+    """Roots the given unrooted tree at the taxon with ID 0 and returns the resulting post-order node list."""
+    root_leaf = next(
+        node for node, label in leaf_labels.items() if taxon_ids[label] == 0
+    )
+
+    post_order: PostOrderTree = []
+    position: dict[int, int] = {}
+    stack = [(neighbors[root_leaf][0], root_leaf, False)]
+
+    while stack:
+        node, parent, visited = stack.pop()
+        children = [c for c in neighbors[node] if c != parent]
+        if visited:
+            position[node] = len(post_order)
+            if children:
+                post_order.append(tuple(position[c] for c in children))
+            else:
+                post_order.append(taxon_ids[leaf_labels[node]])
+        else:
+            stack.append((node, parent, True))
+            stack.extend((c, node, False) for c in reversed(children))
+
+    return post_order
+
+
+def _parse_trees(trees_file: pathlib.Path) -> tuple[list[PostOrderTree], int]:
+    newick_strings = [t.strip() for t in trees_file.read_text().split(";")]
+    newick_strings = [t for t in newick_strings if t]
+
+    if not newick_strings:
+        raise PyPythiaException(
+            f"The trees file {trees_file} does not contain any trees."
+        )
+
+    taxon_ids = None
+    trees = []
+
+    for newick in newick_strings:
+        neighbors, leaf_labels = _parse_newick(newick)
+
+        if taxon_ids is None:
+            taxon_ids = {label: i for i, label in enumerate(leaf_labels.values())}
+            if len(taxon_ids) < 2:
+                raise PyPythiaException(
+                    f"The trees in the trees file {trees_file} need to have at least two taxa."
+                )
+        taxa = set(leaf_labels.values())
+        if len(leaf_labels) != len(taxon_ids) or taxa != taxon_ids.keys():
+            raise PyPythiaException(
+                f"All trees in the trees file {trees_file} need to have the same set of taxa."
+            )
+
+        trees.append(_to_post_order(neighbors, leaf_labels, taxon_ids))
+
+    return trees, len(taxon_ids)
+
+
+def _leaf_ranks(tree: PostOrderTree, n_taxa: int) -> list[int]:
+    """Returns the rank of each taxon in the DFS leaf order of the given tree."""
+    ranks = [0] * n_taxa
+    rank = 0
+    for node in tree:
+        if isinstance(node, int):
+            ranks[node] = rank
+            rank += 1
+    return ranks
+
+
+def _cluster_intervals(
+    tree: PostOrderTree, ranks: list[int]
+) -> list[tuple[int, int, int]]:
+    """Computes the (min, max, size) triple of leaf ranks for all non-trivial clusters of the given tree."""
+    mins = [0] * len(tree)
+    maxs = [0] * len(tree)
+    sizes = [0] * len(tree)
+    clusters = []
+
+    for i, node in enumerate(tree):
+        if isinstance(node, int):
+            mins[i] = maxs[i] = ranks[node]
+            sizes[i] = 1
+        else:
+            mins[i] = min(mins[c] for c in node)
+            maxs[i] = max(maxs[c] for c in node)
+            sizes[i] = sum(sizes[c] for c in node)
+            clusters.append((mins[i], maxs[i], sizes[i]))
+
+    # the last cluster contains all taxa except for the root taxon and is thus trivial
+    return clusters[:-1]
+
+
+def _bipartition_bitsets(tree: PostOrderTree, n_taxa: int) -> set[bytes]:
+    """Returns the set of non-trivial bipartitions of the given tree, each encoded as packed uint64 bitset.
+
+    Since all trees are rooted at taxon 0, no cluster contains taxon 0. Each bipartition is thus represented by
+    the side not containing taxon 0, which is a canonical representation without requiring an additional
+    complement step.
+    """
+    n_words = (n_taxa + 63) // 64
+    bits = np.zeros((len(tree), n_words), dtype=np.uint64)
+    bipartitions = []
+
+    for k, node in enumerate(tree):
+        if isinstance(node, int):
+            bits[k, node >> 6] = np.uint64(1) << np.uint64(node & 63)
+        else:
+            bits[k] = np.bitwise_or.reduce(bits[list(node)], axis=0)
+            bipartitions.append(bits[k].tobytes())
+
+    # the last cluster contains all taxa except for the root taxon and is thus trivial
+    return set(bipartitions[:-1])
+
+
+def _bitset_rfdists(
+    trees: list[PostOrderTree], n_taxa: int, pair_i: npt.NDArray, pair_j: npt.NDArray
+) -> npt.NDArray:
+    bipartitions = [_bipartition_bitsets(tree, n_taxa) for tree in trees]
+    return np.array(
+        [
+            len(bipartitions[i])
+            + len(bipartitions[j])
+            - 2 * len(bipartitions[i] & bipartitions[j])
+            for i, j in zip(pair_i, pair_j)
+        ],
+        dtype=np.int64,
+    )
+
+
+def _interval_rfdists(
+    trees: list[PostOrderTree], n_taxa: int, pair_i: npt.NDArray, pair_j: npt.NDArray
+) -> npt.NDArray:
+    rfdists = np.zeros(pair_i.shape[0], dtype=np.int64)
+    reference_index = None
+
+    for k, (i, j) in enumerate(zip(pair_i, pair_j)):
+        if i != reference_index:
+            reference_index = i
+            ranks = _leaf_ranks(trees[i], n_taxa)
+            reference_clusters = _cluster_intervals(trees[i], ranks)
+            reference_intervals = {(lo, hi) for lo, hi, _ in reference_clusters}
+
+        clusters = _cluster_intervals(trees[j], ranks)
+        shared = sum(
+            1
+            for lo, hi, size in clusters
+            if hi - lo + 1 == size and (lo, hi) in reference_intervals
+        )
+        rfdists[k] = len(reference_clusters) + len(clusters) - 2 * shared
+
+    return rfdists
+
+
+def rfdist_from_newick_file(trees_file: pathlib.Path) -> tuple[float, float, float]:
+    """Computes the number of unique topologies, relative RF-Distance, and absolute RF-Distance for the given set of trees.
+
+    The pairwise RF-Distances are computed in linear time per pair of trees using Day's algorithm.
+    All trees are rooted at the same taxon such that each bipartition corresponds to exactly one cluster.
+    Using the DFS leaf order of the reference tree, each of its clusters is a contiguous interval of leaf ranks.
+    A cluster of the second tree is thus also present in the reference tree if and only if its leaf ranks
+    form a contiguous interval (`max - min + 1 == size`) and this interval is a cluster of the reference tree.
+
+    For trees with at most 256 taxa, the bipartitions are instead encoded as packed uint64 bitsets
+    and the RF-Distance is computed via set intersections of the bitsets.
+
+    Args:
+        trees_file (pathlib.Path): Filepath pointing to the file containing the trees in Newick format.
+
+    Returns:
+        num_topos (float): Number of unique topologies of the given set of trees.
+        rel_rfdist (float): Relative RF-Distance of the given set of trees. Computed as average over all pairwise RF-Distances. Value between 0.0 and 1.0.
+        abs_rfdist (float): Absolute RF-Distance of the given set of trees.
+
+    Raises:
+        PyPythiaException: If the trees file contains no trees, the trees have less than two taxa,
+            or the trees are defined on different sets of taxa.
+    """
+    trees, n_taxa = _parse_trees(trees_file)
+    n_trees = len(trees)
+    pair_i, pair_j = np.triu_indices(n_trees, k=1)
+
+    if n_taxa <= _MAX_BITSET_TAXA:
+        rfdists = _bitset_rfdists(trees, n_taxa, pair_i, pair_j)
+    else:
+        rfdists = _interval_rfdists(trees, n_taxa, pair_i, pair_j)
+
+    # a tree represents a new topology unless it is identical to one of the previous trees
+    is_duplicate = np.zeros(n_trees, dtype=bool)
+    is_duplicate[pair_j[rfdists == 0]] = True
+    num_topos = n_trees - is_duplicate.sum()
+
+    if rfdists.size == 0:
+        return float(num_topos), 0.0, 0.0
+
+    abs_rfdist = rfdists.mean()
+    max_rfdist = 2 * (n_taxa - 3)
+    rel_rfdist = abs_rfdist / max_rfdist if max_rfdist > 0 else 0.0
+
+    return float(num_topos), float(rel_rfdist), float(abs_rfdist)
@@ -49,11 +49,6 @@ def multiple_trees_path():
     return pathlib.Path.cwd() / "tests" / "data" / "trees" / "many.trees"
 
 
-@pytest.fixture
-def raxmlng_rfdistance_log():
-    return pathlib.Path.cwd() / "tests" / "data" / "logs" / "raxml.rfdistance.log"
-
-
 @pytest.fixture
 def raxmlng_inference_log():
     return pathlib.Path.cwd() / "tests" / "data" / "logs" / "raxml.inference.log"
@@ -0,0 +1,24 @@
+import sys
+
+import pytest
+
+from pypythia.main import _parse_cli, _read_msa_list
+
+
+def test_read_msa_list(tmp_path):
+    msa_list_file = tmp_path / "msas.txt"
+    msa_list_file.write_text("b.phy\n\n  /data/a.fasta  \nc.phy\n\n")
+
+    msa_files = _read_msa_list(msa_list_file)
+    assert [str(f) for f in msa_files] == ["b.phy", "/data/a.fasta", "c.phy"]
+
+
+@pytest.mark.parametrize("option", ["--storeTrees", "--shap", "--verbose"])
+def test_parse_cli_msa_list_rejects_unsupported_options(monkeypatch, capsys, option):
+    monkeypatch.setattr(
+        sys, "argv", ["pythia", "--msa-list", "msas.txt", "-r", "raxml-ng", option]
+    )
+
+    with pytest.raises(SystemExit):
+        _parse_cli()
+    assert option in capsys.readouterr().err
@@ -186,3 +186,18 @@ class TestMSAFeatures:
             msa_file = pathlib.Path(row.msa_file)
             msa = parse(msa_file)
             assert msa.bollback_multinomial() == row.bollback_multinomial
+
+    def test_features_are_cached(self, phylip_msa_file):
+        msa = parse(phylip_msa_file)
+        entropy = msa.entropy()
+        n_patterns = msa.n_patterns
+
+        # with identical sites, recomputing the features would yield different values
+        identical_sites = np.repeat(msa.sequences[:, :1], msa.n_sites, axis=1)
+        uncached = MSA(msa.taxa, identical_sites, msa.data_type, msa.name)
+        assert uncached.entropy() != entropy
+        assert uncached.n_patterns != n_patterns
+
+        msa.sequences = identical_sites
+        assert msa.entropy() == entropy
+        assert msa.n_patterns == n_patterns
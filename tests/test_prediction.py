@@ -0,0 +1,46 @@
+import pathlib
+
+import numpy as np
+import pytest
+from lightgbm.basic import LightGBMError
+
+from pypythia.prediction import FEATURE_NAMES, predict_batch, predict_difficulty
+
+
+def test_predict_batch(raxmlng_command, phylip_msa_file, tmp_path):
+    missing_msa_file = tmp_path / "does_not_exist.phy"
+    example_msa_file = pathlib.Path.cwd() / "examples" / "example.phy"
+    msa_files = [example_msa_file, missing_msa_file, phylip_msa_file]
+
+    results = predict_batch(msa_files, raxmlng=raxmlng_command, threads=2, n_workers=2)
+
+    assert list(results.columns) == [*FEATURE_NAMES, "difficulty", "msa_file"]
+    assert results["msa_file"].tolist() == [str(f) for f in msa_files]
+
+    assert np.isnan(results["difficulty"][1])
+    for i in [0, 2]:
+        assert results["difficulty"][i] == pytest.approx(
+            predict_difficulty(msa_files[i], raxmlng=raxmlng_command, threads=2)
+        )
+
+
+def test_predict_batch_failed_predictions_keep_order(tmp_path):
+    msa_files = [tmp_path / f"{i}.phy" for i in range(5)]
+    msa_files[2].write_text("this is not an MSA")
+
+    results = predict_batch(msa_files, raxmlng=tmp_path / "raxml-ng", threads=1)
+
+    assert results.shape[0] == len(msa_files)
+    assert results["msa_file"].tolist() == [str(f) for f in msa_files]
+    assert results["difficulty"].isna().all()
+
+
+def test_predict_batch_invalid_model_file_raises(tmp_path):
+    msa_files = [tmp_path / "0.phy"]
+
+    with pytest.raises(LightGBMError):
+        predict_batch(
+            msa_files,
+            model_file=tmp_path / "does_not_exist.txt",
+            raxmlng=tmp_path / "raxml-ng",
+        )
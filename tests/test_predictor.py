@@ -32,6 +32,26 @@ class TestPredictor:
         assert isinstance(prediction, float)
         assert 0.0 <= prediction <= 1.0
 
+    def test_predict_with_dict_query(self, predictor):
+        query = {
+            "num_patterns/num_taxa": 3.5,
+            "num_sites/num_taxa": 11.2,
+            "num_patterns/num_sites": 0.3,
+            "proportion_gaps": 0.08,
+            "proportion_invariant": 0.6,
+            "entropy": 0.2,
+            "pattern_entropy": 1760.3,
+            "bollback": -3326.8,
+            "avg_rfdist_parsimony": 0.1,
+            "proportion_unique_topos_parsimony": 0.25,
+        }
+
+        prediction = predictor.predict(query)
+        expected = predictor.predict(pd.DataFrame(query, index=[0]))
+
+        assert prediction.shape == (1,)
+        np.testing.assert_array_equal(prediction, expected)
+
     def test_predict_with_multiple_queries(self, predictor):
         query = pd.DataFrame(
             {
@@ -4,23 +4,92 @@ from tempfile import TemporaryDirectory
 
 import pytest
 
+from pypythia import raxmlng as raxmlng_module
 from pypythia.custom_errors import RAxMLNGError
-from pypythia.raxmlng import _get_raxmlng_rfdist_results, run_raxmlng_command
+from pypythia.raxmlng import (
+    RAxMLNG,
+    _parse_raxmlng_version,
+    _select_isa_binary,
+    run_raxmlng_command,
+)
+
+
+def test_parse_raxmlng_version():
+    version_output = (
+        "RAxML-NG v. 1.2.2 released on 11.04.2024 by The Exelixis Lab.\n"
+        "Developed by: Alexey M. Kozlov and Alexandros Stamatakis.\n"
+    )
+    assert _parse_raxmlng_version(version_output) == (1, 2, 2)
+    assert _parse_raxmlng_version("this is not raxml-ng") is None
+
+
+def test_select_isa_binary(tmp_path, monkeypatch):
+    monkeypatch.setattr(raxmlng_module, "_cpu_flags", lambda: {"sse3", "avx", "avx2"})
+
+    for name in ["raxml-ng", "raxml-ng-sse3", "raxml-ng-avx2", "raxml-ng-avx512"]:
+        binary = tmp_path / name
+        binary.touch(mode=0o755)
+
+    exe_path = tmp_path / "raxml-ng"
+    assert _select_isa_binary(exe_path) == tmp_path / "raxml-ng-avx2"
+    assert _select_isa_binary(tmp_path) == tmp_path / "raxml-ng-avx2"
+
+    monkeypatch.setattr(raxmlng_module, "_cpu_flags", lambda: set())
+    assert _select_isa_binary(exe_path) == exe_path
+    assert _select_isa_binary(tmp_path) == exe_path
+
+
+def test_cpu_flags_darwin(monkeypatch):
+    class _Output:
+        stdout = "FPU SSE SSE2 SSE3 AVX1.0\nAVX2\n"
+
+    monkeypatch.setattr(raxmlng_module.sys, "platform", "darwin")
+    monkeypatch.setattr(raxmlng_module.subprocess, "run", lambda *_, **__: _Output)
+
+    assert {"sse3", "avx", "avx2"} <= raxmlng_module._cpu_flags()
+
+
+def test_raxmlng_version(raxmlng):
+    assert raxmlng.version is not None
+
 
+@pytest.mark.parametrize(
+    "version, threads, expected_args",
+    [
+        ((1, 0, 3), 4, ["--threads", "4"]),
+        ((1, 2, 0), 4, ["--workers", "2", "--threads", "auto{4}"]),
+        ((1, 2, 0), "4", ["--workers", "2", "--threads", "auto{4}"]),
+        ((1, 2, 0), "auto{8}", ["--workers", "auto", "--threads", "auto{8}"]),
+        ((1, 2, 0), "auto", ["--workers", "auto", "--threads", "auto"]),
+    ],
+)
+def test_infer_parsimony_trees_workers_version_gate(
+    tmp_path, monkeypatch, version, threads, expected_args
+):
+    commands = []
+    monkeypatch.setattr(RAxMLNG, "version", version)
+    monkeypatch.setattr(raxmlng_module, "run_raxmlng_command", commands.append)
 
-def test_get_raxmlng_rfdist_results(raxmlng_rfdistance_log):
-    num_topos, rel_rfdist, abs_rfdist = _get_raxmlng_rfdist_results(
-        raxmlng_rfdistance_log
+    raxmlng = RAxMLNG(tmp_path / "raxml-ng", select_isa_binary=False)
+    raxmlng.infer_parsimony_trees(
+        msa_file=tmp_path / "msa.phy",
+        model="GTR+G",
+        prefix=tmp_path / "pars",
+        n_trees=24,
+        threads=threads,
     )
 
-    assert num_topos == 2
-    assert rel_rfdist == pytest.approx(1 / 3, abs=0.01)
-    assert abs_rfdist == pytest.approx(2)
+    (cmd,) = commands
+    assert cmd[-len(expected_args) :] == expected_args
+    assert ("--workers" in cmd) == (version >= (1, 1, 0))
 
 
-def test_get_raxmlng_rfdist_results_raises_value_error(raxmlng_inference_log):
-    with pytest.raises(ValueError):
-        test_get_raxmlng_rfdist_results(raxmlng_inference_log)
+def test_set_exe_path(tmp_path):
+    raxmlng = RAxMLNG(tmp_path / "raxml-ng", select_isa_binary=False)
+    raxmlng.exe_path = tmp_path / "other-raxml-ng"
+
+    cmd = raxmlng._base_cmd(tmp_path / "msa.phy", "GTR+G", tmp_path / "test")
+    assert cmd[0] == str((tmp_path / "other-raxml-ng").absolute())
 
 
 def test_infer_parsimony_trees(raxmlng, phylip_msa_file):
@@ -38,6 +107,22 @@ def test_infer_parsimony_trees(raxmlng, phylip_msa_file):
         assert len(trees) == 10
 
 
+def test_infer_parsimony_trees_with_threads(raxmlng, phylip_msa_file):
+    with TemporaryDirectory() as tmpdir:
+        file_path = raxmlng.infer_parsimony_trees(
+            msa_file=phylip_msa_file,
+            model="GTR+G",
+            prefix=pathlib.Path(tmpdir) / "pars",
+            n_trees=24,
+            threads=2,
+        )
+
+        trees = file_path.open().readlines()
+        trees = [t.strip() for t in trees if t]
+
+        assert len(trees) == 24
+
+
 def test_get_rfdistance_results(raxmlng, multiple_trees_path):
     num_topos, rel_rfdist, abs_rfdist = raxmlng.get_rfdistance_results(
         multiple_trees_path
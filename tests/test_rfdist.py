@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from pypythia.custom_errors import PyPythiaException
+from pypythia.rfdist import (
+    _bitset_rfdists,
+    _interval_rfdists,
+    _parse_trees,
+    rfdist_from_newick_file,
+)
+
+
+def test_rfdist_from_newick_file(multiple_trees_path):
+    num_topos, rel_rfdist, abs_rfdist = rfdist_from_newick_file(multiple_trees_path)
+    assert num_topos == 6
+    assert rel_rfdist == pytest.approx(0.114, abs=0.01)
+    assert abs_rfdist == pytest.approx(22.269, abs=0.1)
+
+
+def test_rfdist_from_newick_file_two_trees(tmp_path):
+    trees_file = tmp_path / "trees.newick"
+    trees_file.write_text("((A,B),(C,D),(E,F));\n((A,C),(B,D),(E,F));\n")
+
+    num_topos, rel_rfdist, abs_rfdist = rfdist_from_newick_file(trees_file)
+    assert num_topos == 2
+    assert rel_rfdist == pytest.approx(2 / 3)
+    assert abs_rfdist == pytest.approx(4)
+
+
+def test_rfdist_from_newick_file_ignores_rooting_and_branch_lengths(tmp_path):
+    trees_file = tmp_path / "trees.newick"
+    trees_file.write_text(
+        "(((A:0.1,B:0.2)90:0.3,C:0.1),D:0.4,E:0.5);\n"
+        "(A,(B,(C,(D,E))));\n"
+        "((A,B),(C,(D,E)));\n"
+    )
+
+    num_topos, rel_rfdist, abs_rfdist = rfdist_from_newick_file(trees_file)
+    assert num_topos == 1
+    assert rel_rfdist == 0.0
+    assert abs_rfdist == 0.0
+
+
+def test_rfdist_from_newick_file_different_taxa_raises_pypythia_exception(tmp_path):
+    trees_file = tmp_path / "trees.newick"
+    trees_file.write_text("((A,B),(C,D),(E,F));\n((A,B),(C,D),(E,G));\n")
+
+    with pytest.raises(PyPythiaException, match="same set of taxa"):
+        rfdist_from_newick_file(trees_file)
+
+
+def test_rfdist_from_newick_file_single_taxon_raises_pypythia_exception(tmp_path):
+    trees_file = tmp_path / "trees.newick"
+    trees_file.write_text("A;\nA;\n")
+
+    with pytest.raises(PyPythiaException, match="at least two taxa"):
+        rfdist_from_newick_file(trees_file)
+
+
+def test_bitset_and_interval_rfdists_match(multiple_trees_path):
+    trees, n_taxa = _parse_trees(multiple_trees_path)
+    pair_i, pair_j = np.triu_indices(len(trees), k=1)
+
+    np.testing.assert_array_equal(
+        _bitset_rfdists(trees, n_taxa, pair_i, pair_j),
+        _interval_rfdists(trees, n_taxa, pair_i, pair_j),
+    )